@@ -110,6 +110,9 @@ class Train:
     reg_lambda_trend: float = None
     trend_reg_threshold: (bool, float) = None
     reg_lambda_season: float = None
+    compile_model: bool = False  # wrap the model with torch.compile (requires torch>=2.0)
+    trace_ar_net: bool = False  # replace AR-Net and covariate nets with TorchScript traces
+    autocast: bool = False  # run training and validation forward passes in bfloat16 autocast
 
     def __post_init__(self):
         if self.epochs is not None:
@@ -129,6 +132,9 @@ class Train:
             pass
         else:
             raise NotImplementedError("Loss function {} not found".format(self.loss_func))
+        if self.autocast and not hasattr(torch, "autocast"):
+            log.warning("bfloat16 autocast requires torch>=1.10. Training in full precision.")
+            self.autocast = False
 
     def set_auto_batch_epoch(
         self,
@@ -198,3 +204,18 @@ class Covar:
         if self.reg_lambda is not None:
             if self.reg_lambda < 0:
                 raise ValueError("regularization must be >= 0")
+
+
+@dataclass
+class Regressor:
+    reg_lambda: float
+    normalize: (bool, str)
+    mode: str
+
+
+@dataclass
+class Event:
+    lower_window: int
+    upper_window: int
+    reg_lambda: float
+    mode: str
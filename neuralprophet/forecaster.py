@@ -1,10 +1,10 @@
 import time
+import math
 from collections import OrderedDict
-from attrdict import AttrDict
 import numpy as np
 import pandas as pd
 import torch
-from torch.utils.data import DataLoader
+from torch.utils.data import DataLoader, BatchSampler, RandomSampler, SequentialSampler
 from torch import optim
 import logging
 from tqdm import tqdm
@@ -56,6 +56,9 @@ class NeuralProphet:
         train_speed=None,
         normalize="auto",
         impute_missing=True,
+        compile_model=False,
+        trace_ar_net=False,
+        autocast=False,
     ):
         """
         Args:
@@ -118,6 +121,14 @@ class NeuralProphet:
                 potentially useful when under-, over-fitting, or simply in a hurry.
                 applies epochs *= 2**-train_speed, batch_size *= 2**train_speed, learning_rate *= 2**train_speed,
                 default None: equivalent to 0.
+            compile_model (bool): whether to compile the model with torch.compile (requires torch>=2.0).
+                If compilation fails on the first training batch, training continues with the uncompiled model.
+                Only used during fit: the smaller last batch and validation each trigger a recompile,
+                and the uncompiled model is kept once training ends.
+            trace_ar_net (bool): whether to replace the AR-Net and lagged covariate nets with TorchScript traces.
+                Ignored if n_lags == 0. Note: a model with traced nets cannot be pickled.
+            autocast (bool): whether to run training and validation forward passes in bfloat16 autocast
+                (requires torch>=1.10). Predictions are always computed in full precision.
 
             ## Data config
             normalize (str): Type of normalization to apply to the time series.
@@ -196,6 +207,7 @@ class NeuralProphet:
         self.optimizer = None
         self.scheduler = None
         self.model = None
+        self._ar_weights = None
 
         # set during prediction
         self.future_periods = None
@@ -222,8 +234,42 @@ class NeuralProphet:
             d_hidden=self.config_model.d_hidden,
         )
         log.debug(self.model)
+        # direct reference for per-batch regularization, shared with any traced or compiled version of the model
+        self._ar_weights = self.model.ar_weights if self.n_lags > 0 else None
+        if self.config_train.trace_ar_net and self.n_lags > 0:
+            try:
+                self.model.trace_ar_nets()
+            except Exception:
+                log.warning("Failed to trace AR-Net. Falling back to eager execution.", exc_info=True)
         return self.model
 
+    def _compile_model(self, dataset):
+        """Wrap the model with torch.compile and compile it on a warm-up batch.
+
+        torch.compile is lazy, so compilation errors only surface on the first call.
+        The uncompiled model is restored if the warm-up forward or backward pass fails.
+
+        Args:
+            dataset (TimeDataset): Training dataset, used for the warm-up batch
+        Returns:
+            TimeNet model, compiled if successful
+        """
+        if not hasattr(torch, "compile"):
+            log.warning("torch.compile requires torch>=2.0. Training uncompiled model.")
+            return self.model
+        model = self.model
+        try:
+            compiled = torch.compile(model, dynamic=False)
+            inputs, _ = next(dataset.iter_batches(self.config_train.batch_size, shuffle=False))
+            compiled.train()
+            compiled(inputs).sum().backward()
+        except Exception:
+            log.warning("Failed to compile model. Training uncompiled model.", exc_info=True)
+            compiled = model
+        for param in model.parameters():
+            param.grad = None
+        return compiled
+
     def _create_dataset(self, df, predict_mode):
         """Construct dataset from dataframe.
 
@@ -249,6 +295,23 @@ class NeuralProphet:
             regressors_config=self.regressors_config,
         )
 
+    def _create_loader(self, dataset, batch_size, shuffle=False):
+        """Construct a DataLoader which fetches each batch with a single index lookup.
+
+        TimeDataset holds its samples as tensors, so a whole batch of indices can be
+        gathered at once instead of collating one sample dictionary at a time.
+
+        Args:
+            dataset (TimeDataset): dataset to load batches from
+            batch_size (int): number of samples per batch
+            shuffle (bool): whether to reshuffle the samples each epoch
+        Returns:
+            torch DataLoader
+        """
+        sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+        batch_sampler = BatchSampler(sampler, batch_size=batch_size, drop_last=False)
+        return DataLoader(dataset, sampler=batch_sampler, batch_size=None)
+
     def _handle_missing_data(self, df, freq, predicting=False):
         """Checks, auto-imputes and normalizes new data
 
@@ -369,7 +432,7 @@ class NeuralProphet:
                 raise ValueError("Name {name!r} already used for an added regressor.".format(name=name))
 
     def _lr_range_test(self, dataset, skip_start=10, skip_end=10, num_iter=100, start_lr=1e-7, end_lr=100, plot=False):
-        lrtest_loader = DataLoader(dataset, batch_size=self.config_train.batch_size, shuffle=True)
+        lrtest_loader = self._create_loader(dataset, batch_size=self.config_train.batch_size, shuffle=True)
         lrtest_optimizer = optim.AdamW(self.model.parameters(), lr=start_lr)
         with utils.HiddenPrints():
             lr_finder = LRFinder(self.model, lrtest_optimizer, self.config_train.loss_func)
@@ -408,14 +471,14 @@ class NeuralProphet:
             lr_finder.reset()  # to reset the model and optimizer to their initial state
         return max_lr
 
-    def _init_train_loader(self, df):
+    def _init_train_dataset(self, df):
         """Executes data preparation steps and initiates training procedure.
 
         Args:
             df (pd.DataFrame): containing column 'ds', 'y' with training data
 
         Returns:
-            torch DataLoader
+            TimeDataset
         """
         if not self.fitted:
             self.data_params = df_utils.init_data_params(
@@ -441,9 +504,10 @@ class NeuralProphet:
         self.config_train.set_auto_batch_epoch(n_data=len(df))
         self.config_train.apply_train_speed(batch=True, epoch=True)
         dataset = self._create_dataset(df, predict_mode=False)  # needs to be called after set_auto_seasonalities
-        loader = DataLoader(dataset, batch_size=self.config_train.batch_size, shuffle=True)
         if not self.fitted:
             self.model = self._init_model()  # needs to be called after set_auto_seasonalities
+        if self.config_train.compile_model:
+            self.model = self._compile_model(dataset)
         if self.config_train.learning_rate is None:
             self.config_train.learning_rate = self._lr_range_test(dataset)
         self.config_train.apply_train_speed(lr=True)
@@ -452,31 +516,30 @@ class NeuralProphet:
             self.optimizer,
             max_lr=self.config_train.learning_rate,
             epochs=self.config_train.epochs,
-            steps_per_epoch=len(loader),
+            steps_per_epoch=math.ceil(len(dataset) / self.config_train.batch_size),
             final_div_factor=1000,
         )
-        return loader
+        return dataset
 
-    def _init_val_loader(self, df):
+    def _init_val_dataset(self, df):
         """Executes data preparation steps and initiates evaluation procedure.
 
         Args:
             df (pd.DataFrame): containing column 'ds', 'y' with validation data
 
         Returns:
-            torch DataLoader
+            TimeDataset
         """
         df = df_utils.normalize(df, self.data_params)
         dataset = self._create_dataset(df, predict_mode=False)
-        loader = DataLoader(dataset, batch_size=min(1024, len(dataset)), shuffle=False, drop_last=False)
-        return loader
+        return dataset
 
-    def _train_epoch(self, e, loader):
-        """Make one complete iteration over all samples in dataloader and update model after each batch.
+    def _train_epoch(self, e, dataset):
+        """Make one complete iteration over all samples in dataset and update model after each batch.
 
         Args:
             e (int): current epoch number
-            loader (torch DataLoader): Training Dataloader
+            dataset (TimeDataset): Training dataset
         """
         self.model.train()
         reg_lambda_ar = None
@@ -484,14 +547,16 @@ class NeuralProphet:
             reg_lambda_ar = utils.get_regularization_lambda(
                 self.config_train.ar_sparsity, self.config_train.lambda_delay, e
             )
-        for inputs, targets in loader:
+            if reg_lambda_ar is not None and reg_lambda_ar <= 0:
+                reg_lambda_ar = None
+        for inputs, targets in dataset.iter_batches(self.config_train.batch_size, shuffle=True):
             # Run forward calculation
-            predicted = self.model.forward(inputs)
+            predicted = self._forward(inputs)
             # Compute loss.
             loss = self.config_train.loss_func(predicted, targets)
             # Regularize.
             loss, reg_loss = self._add_batch_regualarizations(loss, reg_lambda_ar)
-            self.optimizer.zero_grad()
+            self.optimizer.zero_grad(set_to_none=True)
             loss.backward()
             self.optimizer.step()
             self.scheduler.step()
@@ -501,23 +566,37 @@ class NeuralProphet:
         epoch_metrics = self.metrics.compute(save=True)
         return epoch_metrics
 
+    def _forward(self, inputs):
+        """Run the model forward pass, within bfloat16 autocast if configured.
+
+        Args:
+            inputs (dict): model inputs, as returned by TimeDataset
+
+        Returns:
+            predictions (torch Tensor, float)
+        """
+        if not self.config_train.autocast:
+            return self.model.forward(inputs)
+        with torch.autocast(device_type="cpu", dtype=torch.bfloat16):
+            predicted = self.model.forward(inputs)
+        return predicted.float()
+
     def _add_batch_regualarizations(self, loss, reg_lambda_ar):
         """Add regulatization terms to loss, if applicable
 
         Args:
             loss (torch Tensor, scalar): current batch loss
-            reg_lambda_ar (float): current AR regularization lambda
+            reg_lambda_ar (float): current AR regularization lambda, None if inactive
 
         Returns:
-            loss, reg_loss
+            loss, reg_loss (float if no regularization is active)
         """
-        reg_loss = torch.zeros(1, dtype=torch.float, requires_grad=False)
+        reg_loss = 0.0
 
         # Add regularization of AR weights - sparsify
-        if self.model.n_lags > 0 and reg_lambda_ar is not None and reg_lambda_ar > 0:
-            reg_ar = utils.reg_func_ar(self.model.ar_weights)
-            reg_loss += reg_lambda_ar * reg_ar
-            loss += reg_lambda_ar * reg_ar
+        if self.model.n_lags > 0 and reg_lambda_ar is not None:
+            reg_ar = utils.reg_func_ar(self._ar_weights)
+            reg_loss = reg_loss + reg_lambda_ar * reg_ar
 
         # Regularize trend to be smoother/sparse
         l_trend = self.config_trend.trend_reg
@@ -526,45 +605,44 @@ class NeuralProphet:
                 weights=self.model.get_trend_deltas,
                 threshold=self.config_train.trend_reg_threshold,
             )
-            reg_loss += l_trend * reg_trend
-            loss += l_trend * reg_trend
+            reg_loss = reg_loss + l_trend * reg_trend
 
         # Regularize seasonality: sparsify fourier term coefficients
         l_season = self.config_train.reg_lambda_season
         if self.model.season_dims is not None and l_season is not None and l_season > 0:
             for name in self.model.season_params.keys():
                 reg_season = utils.reg_func_season(self.model.season_params[name])
-                reg_loss += l_season * reg_season
-                loss += l_season * reg_season
+                reg_loss = reg_loss + l_season * reg_season
 
         # Regularize events: sparsify events features coefficients
         if self.events_config is not None or self.country_holidays_config is not None:
             reg_events_loss = utils.reg_func_events(self.events_config, self.country_holidays_config, self.model)
-            reg_loss += reg_events_loss
-            loss += reg_events_loss
+            reg_loss = reg_loss + reg_events_loss
 
         # Regularize regressors: sparsify regressor features coefficients
         if self.regressors_config is not None:
             reg_regressor_loss = utils.reg_func_regressors(self.regressors_config, self.model)
-            reg_loss += reg_regressor_loss
-            loss += reg_regressor_loss
+            reg_loss = reg_loss + reg_regressor_loss
 
+        # reg_loss remains a float zero if no regularization is active
+        if torch.is_tensor(reg_loss):
+            loss = loss + reg_loss
         return loss, reg_loss
 
-    def _evaluate_epoch(self, loader, val_metrics):
-        """Evaluates model performance.
+    def _evaluate_epoch(self, dataset, val_metrics):
+        """Evaluates model performance in a single forward pass over the whole dataset.
 
         Args:
-            loader (torch DataLoader):  instantiated Validation Dataloader (with TimeDataset)
+            dataset (TimeDataset): Validation dataset
             val_metrics (MetricsCollection): validation metrics to be computed.
         Returns:
             dict with evaluation metrics
         """
-        with torch.no_grad():
+        with utils.inference_mode():
             self.model.eval()
-            for inputs, targets in loader:
-                predicted = self.model.forward(inputs)
-                val_metrics.update(predicted=predicted.detach(), target=targets.detach())
+            inputs, targets = dataset[:]
+            predicted = self._forward(inputs)
+            val_metrics.update(predicted=predicted, target=targets)
             val_metrics = val_metrics.compute(save=True)
         return val_metrics
 
@@ -592,7 +670,7 @@ class NeuralProphet:
                     exc_info=True,
                 )
 
-        loader = self._init_train_loader(df)
+        dataset = self._init_train_dataset(df)
         val = df_val is not None
         ## Metrics
         if self.highlight_forecast_step_n is not None:
@@ -600,7 +678,7 @@ class NeuralProphet:
         if not self.normalize == "off":
             self.metrics.set_shift_scale((self.data_params["y"].shift, self.data_params["y"].scale))
         if val:
-            val_loader = self._init_val_loader(df_val)
+            val_dataset = self._init_val_dataset(df_val)
             val_metrics = metrics.MetricsCollection([m.new() for m in self.metrics.batch_metrics])
 
         ## Run
@@ -621,10 +699,10 @@ class NeuralProphet:
             self.metrics.reset()
             if val:
                 val_metrics.reset()
-            epoch_metrics = self._train_epoch(e, loader)
+            epoch_metrics = self._train_epoch(e, dataset)
             metrics_live["{}".format(list(epoch_metrics)[0])] = epoch_metrics[list(epoch_metrics)[0]]
             if val:
-                val_epoch_metrics = self._evaluate_epoch(val_loader, val_metrics)
+                val_epoch_metrics = self._evaluate_epoch(val_dataset, val_metrics)
                 metrics_live["val_{}".format(list(val_epoch_metrics)[0])] = val_epoch_metrics[
                     list(val_epoch_metrics)[0]
                 ]
@@ -647,6 +725,9 @@ class NeuralProphet:
             if plot_live_loss and (e % (1 + self.config_train.epochs // 10) == 0 or e + 1 == self.config_train.epochs):
                 live_loss.send()
 
+        # keep the uncompiled model after training, it can be pickled and does not recompile for new input shapes
+        self.model = getattr(self.model, "_orig_mod", self.model)
+
         ## Metrics
         log.debug("Train Time: {:8.3f}".format(time.time() - start))
         log.debug("Total Batches: {}".format(self.metrics.total_updates))
@@ -665,17 +746,17 @@ class NeuralProphet:
             forecast_pos = 1
         else:
             forecast_pos = self.highlight_forecast_step_n
-        weights = self.model.ar_weights.detach().numpy()
-        weights = weights[forecast_pos - 1, :][::-1]
+        # flip yields contiguous memory, unlike a negative-stride numpy view
+        weights = torch.flip(self._ar_weights[forecast_pos - 1, :].detach(), dims=(0,)).numpy()
         sTPE = utils.symmetric_total_percentage_error(self.true_ar_weights, weights)
         log.info("AR parameters: ", self.true_ar_weights, "\n", "Model weights: ", weights)
         return sTPE
 
-    def _evaluate(self, loader):
+    def _evaluate(self, dataset):
         """Evaluates model performance.
 
         Args:
-            loader (torch DataLoader):  instantiated Validation Dataloader (with TimeDataset)
+            dataset (TimeDataset): Validation dataset
         Returns:
             df with evaluation metrics
         """
@@ -683,7 +764,7 @@ class NeuralProphet:
         if self.highlight_forecast_step_n is not None:
             val_metrics.add_specific_target(target_pos=self.highlight_forecast_step_n - 1)
         ## Run
-        val_metrics_dict = self._evaluate_epoch(loader, val_metrics)
+        val_metrics_dict = self._evaluate_epoch(dataset, val_metrics)
 
         if self.true_ar_weights is not None:
             val_metrics_dict["sTPE"] = self._eval_true_ar()
@@ -797,8 +878,8 @@ class NeuralProphet:
             log.warning("Model has not been fitted. Test results will be random.")
         df = df_utils.check_dataframe(df, check_y=True, covariates=self.config_covar, events=self.events_config)
         df = self._handle_missing_data(df, freq=self.data_freq)
-        loader = self._init_val_loader(df)
-        val_metrics_df = self._evaluate(loader)
+        dataset = self._init_val_dataset(df)
+        val_metrics_df = self._evaluate(dataset)
         return val_metrics_df
 
     def make_future_dataframe(self, df, events_df=None, regressors_df=None, periods=None, n_historic_predictions=0):
@@ -938,11 +1019,11 @@ class NeuralProphet:
         if self.fitted is False:
             log.warning("Model has not been fitted. Predictions will be random.")
         dataset = self._create_dataset(df, predict_mode=True)
-        loader = DataLoader(dataset, batch_size=min(1024, len(df)), shuffle=False, drop_last=False)
+        loader = self._create_loader(dataset, batch_size=min(1024, len(df)))
 
         predicted_vectors = list()
         component_vectors = None
-        with torch.no_grad():
+        with utils.inference_mode():
             self.model.eval()
             for inputs, _ in loader:
                 predicted = self.model.forward(inputs)
@@ -1028,7 +1109,9 @@ class NeuralProphet:
         df = df_utils.check_dataframe(df, check_y=False)
         df = df_utils.normalize(df, self.data_params)
         t = torch.from_numpy(np.expand_dims(df["t"].values, 1))
-        trend = self.model.trend(t).squeeze().detach().numpy()
+        with utils.inference_mode():
+            self.model.eval()
+            trend = self.model.trend(t).squeeze().numpy()
         trend = trend * self.data_params["y"].scale
         return pd.DataFrame({"ds": df["ds"], "trend": trend})
 
@@ -1051,15 +1134,17 @@ class NeuralProphet:
             # n_forecasts=1,
             predict_mode=True,
         )
-        loader = DataLoader(dataset, batch_size=min(4096, len(df)), shuffle=False, drop_last=False)
+        loader = self._create_loader(dataset, batch_size=min(4096, len(df)))
         predicted = OrderedDict()
         for name in self.season_config.periods:
             predicted[name] = list()
-        for inputs, _ in loader:
-            for name in self.season_config.periods:
-                features = inputs["seasonalities"][name]
-                y_season = torch.squeeze(self.model.seasonality(features=features, name=name))
-                predicted[name].append(y_season.data.numpy())
+        with utils.inference_mode():
+            self.model.eval()
+            for inputs, _ in loader:
+                for name in self.season_config.periods:
+                    features = inputs["seasonalities"][name]
+                    y_season = torch.squeeze(self.model.seasonality(features=features, name=name))
+                    predicted[name].append(y_season.numpy())
 
         for name in self.season_config.periods:
             predicted[name] = np.concatenate(predicted[name])
@@ -1147,7 +1232,7 @@ class NeuralProphet:
 
         if self.regressors_config is None:
             self.regressors_config = OrderedDict({})
-        self.regressors_config[name] = AttrDict({"trend_reg": regularization, "normalize": normalize, "mode": mode})
+        self.regressors_config[name] = configure.Regressor(reg_lambda=regularization, normalize=normalize, mode=mode)
         return self
 
     def add_events(self, events, lower_window=0, upper_window=0, regularization=None, mode="additive"):
@@ -1181,8 +1266,8 @@ class NeuralProphet:
 
         for event_name in events:
             self._validate_column_name(event_name)
-            self.events_config[event_name] = AttrDict(
-                {"lower_window": lower_window, "upper_window": upper_window, "trend_reg": regularization, "mode": mode}
+            self.events_config[event_name] = configure.Event(
+                lower_window=lower_window, upper_window=upper_window, reg_lambda=regularization, mode=mode
             )
         return self
 
@@ -1215,7 +1300,7 @@ class NeuralProphet:
         self.country_holidays_config["country"] = country_name
         self.country_holidays_config["lower_window"] = lower_window
         self.country_holidays_config["upper_window"] = upper_window
-        self.country_holidays_config["trend_reg"] = regularization
+        self.country_holidays_config["reg_lambda"] = regularization
         self.country_holidays_config["holiday_names"] = utils.get_holidays_from_country(country_name)
         self.country_holidays_config["mode"] = mode
         return self
@@ -52,12 +52,11 @@ class MetricsCollection:
                 containing average values over batch/update step
             num (int): number of samples in batch/update step
         """
-        for name, value in values.items():
-            if name in self.value_metrics.keys():
-                self.value_metrics[name].update(avg_value=value, num=num)
-        not_updated = set(self.value_metrics.keys()) - set(values.keys())
-        if len(not_updated) > 0:
-            raise ValueError("Metrics {} defined but not updated.".format(not_updated))
+        for name, metric in self.value_metrics.items():
+            if name not in values:
+                not_updated = set(self.value_metrics.keys()) - set(values.keys())
+                raise ValueError("Metrics {} defined but not updated.".format(not_updated))
+            metric.update(avg_value=values[name], num=num)
 
     def update(self, predicted, target, values=None):
         """update all metrics.
@@ -397,9 +396,9 @@ class ValueMetric(Metric):
         """
 
         Args:
-            avg_value (float): average value over batch/update step
+            avg_value (float, torch tensor): average value over batch/update step
             num (int): number of samples in batch/update step
         """
         self.total_updates += 1
-        self._sum += avg_value.data.item() * num
+        self._sum += float(avg_value) * num
         self._num_examples += num
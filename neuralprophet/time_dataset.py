@@ -63,7 +63,9 @@ class TimeDataset(Dataset):
         """Overrides parent class method to get an item at index.
 
         Args:
-            index (int): sample location in dataset
+            index (int, slice, list, torch tensor): sample location in dataset.
+                A slice, list or tensor of indices returns the whole batch at once,
+                with a leading batch dimension added to all dims below.
 
         Returns:
             sample (OrderedDict): model inputs
@@ -79,7 +81,6 @@ class TimeDataset(Dataset):
                     each with features (np.array, float) of dims: (n_lags)
             targets (torch tensor, float): targets to be predicted, dims: (n_forecasts)
         """
-        # Future TODO: vectorize
         sample = OrderedDict({})
         for key, data in self.inputs.items():
             if key in self.two_level_inputs:
@@ -99,6 +100,25 @@ class TimeDataset(Dataset):
         """Overrides Parent class method to get data length."""
         return self.length
 
+    def iter_batches(self, batch_size, shuffle=False):
+        """Iterate over the dataset in batches, without a DataLoader.
+
+        Each batch is gathered with a single index lookup into the stored tensors.
+
+        Args:
+            batch_size (int): number of samples per batch, the last batch may be smaller
+            shuffle (bool): whether to draw the samples in random order
+
+        Yields:
+            sample, targets: batch of model inputs and targets, as returned by __getitem__
+        """
+        if shuffle:
+            order = torch.randperm(self.length)
+        else:
+            order = torch.arange(self.length)
+        for start in range(0, self.length, batch_size):
+            yield self[order[start : start + batch_size]]
+
 
 def tabularize_univariate_datetime(
     df,
@@ -151,7 +171,8 @@ def tabularize_univariate_datetime(
 
     def _stride_time_features_for_forecasts(x):
         # only for case where n_lags > 0
-        return np.array([x[n_lags + i : n_lags + i + n_forecasts] for i in range(n_samples)])
+        # gathers x[n_lags + i : n_lags + i + n_forecasts] for all samples i at once
+        return x[n_lags + np.arange(n_samples)[:, np.newaxis] + np.arange(n_forecasts)]
 
     # time is the time at each forecast step
     t = df.loc[:, "t"].values
@@ -174,8 +195,9 @@ def tabularize_univariate_datetime(
 
     def _stride_lagged_features(df_col_name, feature_dims):
         # only for case where n_lags > 0
+        # gathers series[i + n_lags - feature_dims : i + n_lags] for all samples i at once
         series = df.loc[:, df_col_name].values
-        return np.array([series[i + n_lags - feature_dims : i + n_lags] for i in range(n_samples)])
+        return series[n_lags - feature_dims + np.arange(n_samples)[:, np.newaxis] + np.arange(feature_dims)]
 
     if n_lags > 0 and "y" in df.columns:
         inputs["lags"] = _stride_lagged_features(df_col_name="y_scaled", feature_dims=n_lags)
@@ -207,25 +229,11 @@ def tabularize_univariate_datetime(
             if multiplicative_regressors is not None:
                 regressors["multiplicative"] = np.expand_dims(multiplicative_regressors, axis=1)
         else:
+            # stride into num_forecast at dim=1 for each sample, just like we did with time
             if additive_regressors is not None:
-                additive_regressor_feature_windows = []
-                for i in range(0, additive_regressors.shape[1]):
-                    # stride into num_forecast at dim=1 for each sample, just like we did with time
-                    additive_regressor_feature_windows.append(
-                        _stride_time_features_for_forecasts(additive_regressors[:, i])
-                    )
-                additive_regressors = np.dstack(additive_regressor_feature_windows)
-                regressors["additive"] = additive_regressors
-
+                regressors["additive"] = _stride_time_features_for_forecasts(additive_regressors)
             if multiplicative_regressors is not None:
-                multiplicative_regressor_feature_windows = []
-                for i in range(0, multiplicative_regressors.shape[1]):
-                    # stride into num_forecast at dim=1 for each sample, just like we did with time
-                    multiplicative_regressor_feature_windows.append(
-                        _stride_time_features_for_forecasts(multiplicative_regressors[:, i])
-                    )
-                multiplicative_regressors = np.dstack(multiplicative_regressor_feature_windows)
-                regressors["multiplicative"] = multiplicative_regressors
+                regressors["multiplicative"] = _stride_time_features_for_forecasts(multiplicative_regressors)
 
         inputs["regressors"] = regressors
 
@@ -240,23 +248,11 @@ def tabularize_univariate_datetime(
             if multiplicative_events is not None:
                 events["multiplicative"] = np.expand_dims(multiplicative_events, axis=1)
         else:
+            # stride into num_forecast at dim=1 for each sample, just like we did with time
             if additive_events is not None:
-                additive_event_feature_windows = []
-                for i in range(0, additive_events.shape[1]):
-                    # stride into num_forecast at dim=1 for each sample, just like we did with time
-                    additive_event_feature_windows.append(_stride_time_features_for_forecasts(additive_events[:, i]))
-                additive_events = np.dstack(additive_event_feature_windows)
-                events["additive"] = additive_events
-
+                events["additive"] = _stride_time_features_for_forecasts(additive_events)
             if multiplicative_events is not None:
-                multiplicative_event_feature_windows = []
-                for i in range(0, multiplicative_events.shape[1]):
-                    # stride into num_forecast at dim=1 for each sample, just like we did with time
-                    multiplicative_event_feature_windows.append(
-                        _stride_time_features_for_forecasts(multiplicative_events[:, i])
-                    )
-                multiplicative_events = np.dstack(multiplicative_event_feature_windows)
-                events["multiplicative"] = multiplicative_events
+                events["multiplicative"] = _stride_time_features_for_forecasts(multiplicative_events)
 
         inputs["events"] = events
 
@@ -366,7 +362,7 @@ def make_events_features(df, events_config=None, country_holidays_config=None):
             feature = df[event]
             lw = configs.lower_window
             uw = configs.upper_window
-            mode = configs["mode"]
+            mode = configs.mode
             # create lower and upper window features
             for offset in range(lw, uw + 1):
                 key = utils.create_event_names_for_offsets(event, offset)
@@ -428,7 +424,7 @@ def make_regressors_features(df, regressors_config):
 
     for reg in df.columns:
         if reg in regressors_config:
-            mode = regressors_config[reg]["mode"]
+            mode = regressors_config[reg].mode
             if mode == "additive":
                 additive_regressors[reg] = df[reg]
             else:
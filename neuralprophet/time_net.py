@@ -145,14 +145,17 @@ class TimeNet(nn.Module):
         self.num_hidden_layers = num_hidden_layers
         self.d_hidden = n_lags + n_forecasts if d_hidden is None else d_hidden
         if self.n_lags > 0:
-            self.ar_net = nn.ModuleList()
+            ar_layers = []
             d_inputs = self.n_lags
             for i in range(self.num_hidden_layers):
-                self.ar_net.append(nn.Linear(d_inputs, self.d_hidden, bias=True))
+                ar_layers.append(nn.Linear(d_inputs, self.d_hidden, bias=True))
+                ar_layers.append(nn.ReLU(inplace=True))
                 d_inputs = self.d_hidden
-            self.ar_net.append(nn.Linear(d_inputs, self.n_forecasts, bias=False))
+            ar_layers.append(nn.Linear(d_inputs, self.n_forecasts, bias=False))
+            self.ar_net = nn.Sequential(*ar_layers)
             for lay in self.ar_net:
-                nn.init.kaiming_normal_(lay.weight, mode="fan_in")
+                if isinstance(lay, nn.Linear):
+                    nn.init.kaiming_normal_(lay.weight, mode="fan_in")
 
         # Covariates
         self.config_covar = config_covar
@@ -160,16 +163,19 @@ class TimeNet(nn.Module):
             assert self.n_lags > 0
             self.covar_nets = nn.ModuleDict({})
             for covar in self.config_covar.keys():
-                covar_net = nn.ModuleList()
+                covar_layers = []
                 d_inputs = self.n_lags
                 if self.config_covar[covar].as_scalar:
                     d_inputs = 1
                 for i in range(self.num_hidden_layers):
-                    covar_net.append(nn.Linear(d_inputs, self.d_hidden, bias=True))
+                    covar_layers.append(nn.Linear(d_inputs, self.d_hidden, bias=True))
+                    covar_layers.append(nn.ReLU(inplace=True))
                     d_inputs = self.d_hidden
-                covar_net.append(nn.Linear(d_inputs, self.n_forecasts, bias=False))
+                covar_layers.append(nn.Linear(d_inputs, self.n_forecasts, bias=False))
+                covar_net = nn.Sequential(*covar_layers)
                 for lay in covar_net:
-                    nn.init.kaiming_normal_(lay.weight, mode="fan_in")
+                    if isinstance(lay, nn.Linear):
+                        nn.init.kaiming_normal_(lay.weight, mode="fan_in")
                 self.covar_nets[covar] = covar_net
 
         ## Regressors
@@ -214,11 +220,28 @@ class TimeNet(nn.Module):
     @property
     def ar_weights(self):
         """sets property auto-regression weights for regularization. Update if AR is modelled differently"""
-        return self.ar_net[0].weight
+        # first layer accessed by name, as traced nets do not support indexing
+        return getattr(self.ar_net, "0").weight
 
     def get_covar_weights(self, name):
         """sets property auto-regression weights for regularization. Update if AR is modelled differently"""
-        return self.covar_nets[name][0].weight
+        return getattr(self.covar_nets[name], "0").weight
+
+    def trace_ar_nets(self):
+        """Replaces the AR-Net and covariate nets with TorchScript traces of themselves.
+
+        The traced nets share their parameters with the original nets.
+        All nets are traced before any is replaced, so a failed trace leaves the model unchanged.
+        """
+        ar_net = torch.jit.trace(self.ar_net, torch.zeros(1, self.n_lags))
+        covar_nets = {}
+        if self.config_covar is not None:
+            for covar in self.config_covar.keys():
+                d_inputs = 1 if self.config_covar[covar].as_scalar else self.n_lags
+                covar_nets[covar] = torch.jit.trace(self.covar_nets[covar], torch.zeros(1, d_inputs))
+        self.ar_net = ar_net
+        for covar, net in covar_nets.items():
+            self.covar_nets[covar] = net
 
     def get_event_weights(self, name):
         """
@@ -376,12 +399,7 @@ class TimeNet(nn.Module):
         Returns:
             forecast component of dims: (batch, n_forecasts)
         """
-        x = lags
-        for i in range(self.num_hidden_layers + 1):
-            if i > 0:
-                x = nn.functional.relu(x)
-            x = self.ar_net[i](x)
-        return x
+        return self.ar_net(lags)
 
     def covariate(self, lags, name):
         """Compute single covariate component.
@@ -394,12 +412,7 @@ class TimeNet(nn.Module):
         Returns:
             forecast component of dims (batch, n_forecasts)
         """
-        x = lags
-        for i in range(self.num_hidden_layers + 1):
-            if i > 0:
-                x = nn.functional.relu(x)
-            x = self.covar_nets[name][i](x)
-        return x
+        return self.covar_nets[name](lags)
 
     def all_covariates(self, covariates):
         """Compute all covariate components.
@@ -574,7 +587,7 @@ class FlatNet(nn.Module):
 
     @property
     def ar_weights(self):
-        return self.model.layers[0].weight
+        return self.layers[0].weight
 
 
 class DeepNet(nn.Module):
@@ -585,24 +598,22 @@ class DeepNet(nn.Module):
     def __init__(self, d_inputs, d_outputs, d_hidden=32, num_hidden_layers=0):
         # Perform initialization of the pytorch superclass
         super(DeepNet, self).__init__()
-        self.layers = nn.ModuleList()
+        layers = []
         for i in range(num_hidden_layers):
-            self.layers.append(nn.Linear(d_inputs, d_hidden, bias=True))
+            layers.append(nn.Linear(d_inputs, d_hidden, bias=True))
+            layers.append(nn.ReLU(inplace=True))
             d_inputs = d_hidden
-        self.layers.append(nn.Linear(d_inputs, d_outputs, bias=True))
+        layers.append(nn.Linear(d_inputs, d_outputs, bias=True))
+        self.layers = nn.Sequential(*layers)
         for lay in self.layers:
-            nn.init.kaiming_normal_(lay.weight, mode="fan_in")
+            if isinstance(lay, nn.Linear):
+                nn.init.kaiming_normal_(lay.weight, mode="fan_in")
 
     def forward(self, x):
         """
         This method defines the network layering and activation functions
         """
-        activation = nn.functional.relu
-        for i in range(len(self.layers)):
-            if i > 0:
-                x = activation(x)
-            x = self.layers[i](x)
-        return x
+        return self.layers(x)
 
     @property
     def ar_weights(self):
@@ -4,7 +4,6 @@ import math
 import numpy as np
 import pandas as pd
 import torch
-from attrdict import AttrDict
 from collections import OrderedDict
 from neuralprophet import hdays as hdays_part2
 import holidays as hdays_part1
@@ -46,8 +45,8 @@ def reg_func_ar(weights):
         regularization loss, scalar
 
     """
-    abs_weights = torch.abs(weights.clone())
-    reg = torch.div(2.0, 1.0 + torch.exp(-3 * (1e-12 + abs_weights).pow(1 / 3.0))) - 1.0
+    # 2 / (1 + exp(-x)) - 1 == 2 * sigmoid(x) - 1
+    reg = 2.0 * torch.sigmoid(3.0 * (1e-12 + torch.abs(weights)).pow(1 / 3.0)) - 1.0
     reg = torch.mean(reg).squeeze()
     return reg
 
@@ -94,14 +93,14 @@ def reg_func_events(events_config, country_holidays_config, model):
     reg_events_loss = 0.0
     if events_config is not None:
         for event, configs in events_config.items():
-            reg_lambda = configs["trend_reg"]
+            reg_lambda = configs.reg_lambda
             if reg_lambda is not None:
                 weights = model.get_event_weights(event)
                 for offset in weights.keys():
                     reg_events_loss += reg_lambda * reg_func_abs(weights[offset])
 
     if country_holidays_config is not None:
-        reg_lambda = country_holidays_config["trend_reg"]
+        reg_lambda = country_holidays_config["reg_lambda"]
         if reg_lambda is not None:
             for holiday in country_holidays_config["holiday_names"]:
                 weights = model.get_event_weights(holiday)
@@ -122,7 +121,7 @@ def reg_func_regressors(regressors_config, model):
     """
     reg_regressor_loss = 0.0
     for regressor, configs in regressors_config.items():
-        reg_lambda = configs["trend_reg"]
+        reg_lambda = configs.reg_lambda
         if reg_lambda is not None:
             weight = model.get_reg_weights(regressor)
             reg_regressor_loss += reg_lambda * reg_func_abs(weight)
@@ -134,14 +133,16 @@ def symmetric_total_percentage_error(values, estimates):
     """Compute STPE
 
     Args:
-        values (np.array):
-        estimates (np.array):
+        values (np.array, list):
+        estimates (np.array, list):
 
     Returns:
         scalar (float)
     """
-    sum_abs_diff = np.sum(np.abs(estimates - values))
-    sum_abs = np.sum(np.abs(estimates) + np.abs(values))
+    values = np.asarray(values, dtype=np.float64)
+    estimates = np.asarray(estimates, dtype=np.float64)
+    sum_abs_diff = np.abs(estimates - values).sum()
+    sum_abs = np.abs(estimates).sum() + np.abs(values).sum()
     return 100 * sum_abs_diff / (10e-9 + sum_abs)
 
 
@@ -203,7 +204,7 @@ def events_config_to_model_dims(events_config, country_holidays_config):
             for country specific holidays
 
     Returns:
-        events_dims (OrderedDict): A dictionary with keys corresponding to individual holidays and values in an AttrDict
+        events_dims (OrderedDict): A dictionary with keys corresponding to individual holidays and values in a dict
             with configs such as the mode, list of event delims of the event corresponding to the offsets,
             and the indices in the input dataframe corresponding to each event.
     """
@@ -214,7 +215,7 @@ def events_config_to_model_dims(events_config, country_holidays_config):
 
     if events_config is not None:
         for event, configs in events_config.items():
-            mode = configs["mode"]
+            mode = configs.mode
             for offset in range(configs.lower_window, configs.upper_window + 1):
                 event_delim = create_event_names_for_offsets(event, offset)
                 if mode == "additive":
@@ -257,9 +258,11 @@ def events_config_to_model_dims(events_config, country_holidays_config):
     event_dims_dic = OrderedDict({})
     # convert to dict format
     for event, row in event_dims.groupby("event"):
-        event_dims_dic[event] = AttrDict(
-            {"mode": row["mode"].iloc[0], "event_delim": list(row["event_delim"]), "event_indices": list(row.index)}
-        )
+        event_dims_dic[event] = {
+            "mode": row["mode"].iloc[0],
+            "event_delim": list(row["event_delim"]),
+            "event_indices": list(row.index),
+        }
     return event_dims_dic
 
 
@@ -285,7 +288,7 @@ def regressors_config_to_model_dims(regressors_config):
 
     Returns:
         regressors_dims (OrderedDict): A dictionary with keys corresponding to individual regressors
-            and values in an AttrDict
+            and values in a dict
             with configs such as the mode, and the indices in the input dataframe corresponding to each regressor.
     """
     if regressors_config is None:
@@ -296,7 +299,7 @@ def regressors_config_to_model_dims(regressors_config):
 
         if regressors_config is not None:
             for regressor, configs in regressors_config.items():
-                mode = configs["mode"]
+                mode = configs.mode
                 if mode == "additive":
                     additive_regressors.append(regressor)
                 else:
@@ -319,7 +322,7 @@ def regressors_config_to_model_dims(regressors_config):
         regressors_dims_dic = OrderedDict({})
         # convert to dict format
         for index, row in regressors_dims.iterrows():
-            regressors_dims_dic[row["regressors"]] = AttrDict({"mode": row["mode"], "regressor_index": index})
+            regressors_dims_dic[row["regressors"]] = {"mode": row["mode"], "regressor_index": index}
         return regressors_dims_dic
 
 
@@ -459,6 +462,16 @@ def set_random_seed(seed=0):
     torch.manual_seed(seed)
 
 
+def inference_mode():
+    """Context manager to disable autograd while evaluating a model.
+
+    Uses torch.inference_mode where available (torch>=1.9), else falls back to torch.no_grad.
+    """
+    if hasattr(torch, "inference_mode"):
+        return torch.inference_mode()
+    return torch.no_grad()
+
+
 def set_logger_level(logger, log_level=None, include_handlers=False):
     if log_level is None:
         logger.warning("Failed to set log_level to None.")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import unittest
+from unittest import mock
 import os
 import pathlib
 import pandas as pd
@@ -295,6 +296,32 @@ class IntegrationTests(unittest.TestCase):
             m.plot_parameters()
             plt.show()
 
+    def test_trace_ar_net(self):
+        log.info("testing: traced AR-Net and Lagged Regressors")
+        df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+        m = NeuralProphet(
+            n_forecasts=7,
+            n_lags=14,
+            num_hidden_layers=2,
+            d_hidden=32,
+            weekly_seasonality=False,
+            daily_seasonality=False,
+            epochs=EPOCHS,
+            batch_size=BATCH_SIZE,
+            trace_ar_net=True,
+        )
+        df["A"] = df["y"].rolling(7, min_periods=1).mean()
+        m = m.add_lagged_regressor(name="A")
+
+        metrics_df = m.fit(df, freq="D")
+        assert isinstance(m.model.ar_net, torch.jit.ScriptModule)
+        assert isinstance(m.model.covar_nets["A"], torch.jit.ScriptModule)
+        # regularization and optimizer must both see the traced net's weights
+        assert m._ar_weights is m.model.ar_weights
+        assert any(m._ar_weights is p for group in m.optimizer.param_groups for p in group["params"])
+        future = m.make_future_dataframe(df, n_historic_predictions=90)
+        forecast = m.predict(future)
+
     def test_events(self):
         log.info("testing: Events")
         df = pd.read_csv(PEYTON_FILE)[-NROWS:]
@@ -478,6 +505,54 @@ class IntegrationTests(unittest.TestCase):
         future = m.make_future_dataframe(df, periods=10, n_historic_predictions=10)
         forecast = m.predict(future)
 
+    @unittest.skipUnless(hasattr(torch, "autocast"), "requires torch>=1.10")
+    def test_autocast(self):
+        log.info("TEST bfloat16 autocast")
+        df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+        m = NeuralProphet(
+            n_lags=7,
+            epochs=EPOCHS,
+            batch_size=BATCH_SIZE,
+            autocast=True,
+        )
+        metrics_df = m.fit(df, freq="D", validate_each_epoch=True)
+        future = m.make_future_dataframe(df, periods=10, n_historic_predictions=10)
+        forecast = m.predict(future)
+
+    @unittest.skipUnless(hasattr(torch, "compile"), "requires torch>=2.0")
+    def test_compile_model(self):
+        log.info("TEST compiled model")
+        df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+        m = NeuralProphet(
+            n_lags=7,
+            epochs=EPOCHS,
+            batch_size=BATCH_SIZE,
+            compile_model=True,
+        )
+        metrics_df = m.fit(df, freq="D")
+        assert not hasattr(m.model, "_orig_mod")
+        future = m.make_future_dataframe(df, periods=10, n_historic_predictions=10)
+        forecast = m.predict(future)
+
+    def test_compile_model_fallback(self):
+        log.info("TEST compiled model falls back to eager on compile error")
+        df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+        m = NeuralProphet(
+            n_lags=7,
+            epochs=EPOCHS,
+            batch_size=BATCH_SIZE,
+            compile_model=True,
+        )
+        # torch.compile is lazy: the wrapper is created fine and the first call fails
+        failing_compile = mock.Mock(return_value=mock.MagicMock(side_effect=RuntimeError("compile failed")))
+        with mock.patch.object(torch, "compile", failing_compile, create=True):
+            metrics_df = m.fit(df, freq="D")
+        failing_compile.assert_called_once()
+        assert isinstance(m.model, torch.nn.Module)
+        assert not hasattr(m.model, "_orig_mod")
+        future = m.make_future_dataframe(df, periods=10, n_historic_predictions=10)
+        forecast = m.predict(future)
+
     def test_yosemite(self):
         log.info("TEST Yosemite Temps")
         df = pd.read_csv(YOS_FILE, nrows=NROWS)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import unittest
+from collections import OrderedDict
 import os
 import pathlib
 import math
@@ -8,11 +9,13 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import logging
+import torch
 from neuralprophet import (
     NeuralProphet,
     df_utils,
     time_dataset,
     configure,
+    utils,
 )
 
 log = logging.getLogger("NP.test")
@@ -95,6 +98,59 @@ class UnitTests(unittest.TestCase):
             )
         )
 
+    def test_tabularize_windows(self):
+        n_lags = 5
+        n_forecasts = 3
+        df = pd.DataFrame({"ds": pd.date_range(start="2017-01-01", periods=20), "y": np.arange(20.0)})
+        df = df_utils.check_dataframe(df)
+        data_params = df_utils.init_data_params(df, normalize="off")
+        df = df_utils.normalize(df, data_params)
+        inputs, targets = time_dataset.tabularize_univariate_datetime(df, n_lags=n_lags, n_forecasts=n_forecasts)
+        y = df["y_scaled"].values
+        t = df["t"].values
+        n_samples = len(df) - n_lags - n_forecasts + 1
+        assert inputs["lags"].shape == (n_samples, n_lags)
+        assert targets.shape == (n_samples, n_forecasts)
+        for i in range(n_samples):
+            assert np.array_equal(inputs["lags"][i], y[i : i + n_lags])
+            assert np.array_equal(inputs["time"][i], t[i + n_lags : i + n_lags + n_forecasts])
+            assert np.array_equal(targets[i], y[i + n_lags : i + n_lags + n_forecasts])
+
+        # future regressors and events with a window, strided across all feature columns at once
+        regressors_config = OrderedDict(
+            {
+                "A": configure.Regressor(reg_lambda=None, normalize="off", mode="additive"),
+                "B": configure.Regressor(reg_lambda=None, normalize="off", mode="additive"),
+                "C": configure.Regressor(reg_lambda=None, normalize="off", mode="multiplicative"),
+            }
+        )
+        events_config = OrderedDict(
+            {"E": configure.Event(lower_window=-1, upper_window=1, reg_lambda=None, mode="additive")}
+        )
+        df["A"] = 2.0 * np.arange(20.0)
+        df["B"] = np.sin(np.arange(20.0))
+        df["C"] = np.sqrt(np.arange(20.0))
+        df["E"] = (np.arange(20) % 4 == 0).astype(float)
+        inputs, targets = time_dataset.tabularize_univariate_datetime(
+            df,
+            n_lags=n_lags,
+            n_forecasts=n_forecasts,
+            events_config=events_config,
+            regressors_config=regressors_config,
+        )
+        additive_regressors, multiplicative_regressors = time_dataset.make_regressors_features(df, regressors_config)
+        additive_events, _ = time_dataset.make_events_features(df, events_config)
+        expected = [
+            (inputs["regressors"]["additive"], additive_regressors, 2),
+            (inputs["regressors"]["multiplicative"], multiplicative_regressors, 1),
+            (inputs["events"]["additive"], additive_events, 3),
+        ]
+        assert "multiplicative" not in inputs["events"]
+        for strided, features, n_features in expected:
+            assert strided.shape == (n_samples, n_forecasts, n_features)
+            for i in range(n_samples):
+                assert np.array_equal(strided[i], features[i + n_lags : i + n_lags + n_forecasts, :])
+
     def test_normalize(self):
         for add in [0, -1, 0.00000001, -0.99999999]:
             length = 1000
@@ -134,6 +190,13 @@ class UnitTests(unittest.TestCase):
             assert c.batch_size == batch
             assert c.epochs == epoch
 
+    def test_reg_func_ar(self):
+        weights = torch.randn(3, 10) * 2.0
+        abs_weights = torch.abs(weights)
+        expected = torch.div(2.0, 1.0 + torch.exp(-3 * (1e-12 + abs_weights).pow(1 / 3.0))) - 1.0
+        reg = utils.reg_func_ar(weights)
+        assert math.isclose(reg.item(), torch.mean(expected).item(), rel_tol=1e-5)
+
     def test_train_speed(self):
         df = pd.read_csv(PEYTON_FILE, nrows=102)[:100]
         batch_size = 16